@@ -1,11 +1,146 @@
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import matplotlib.colors as mcolors
-from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.text import Annotation, Text
+from matplotlib.artist import Artist
 import numpy as np
-import random
-from typing import List, Dict, Tuple
-from collections import OrderedDict, defaultdict
+import os
+from functools import lru_cache
+from typing import List, Dict, NamedTuple, Tuple
+
+# numba is opt-in: for the few edges of an intersection compiling the kernels costs more than it saves.
+# Set INTERSECTION_FLOW_NUMBA=1 before the import to compile them, the kernels run as plain NumPy otherwise.
+USE_NUMBA = os.environ.get('INTERSECTION_FLOW_NUMBA') == '1'
+
+if USE_NUMBA:
+    from numba import njit
+else:
+    def njit(*args, **kwargs):
+        def decorator(function):
+            return function
+        return decorator
+
+@njit(fastmath=True)
+def _compute_edge_endpoints(px: np.ndarray, py: np.ndarray, cos: np.ndarray, sin: np.ndarray,
+                            origin_index: np.ndarray, destination_index: np.ndarray,
+                            circular_distances: np.ndarray, n_directions: int,
+                            width_road: float, driving_side_factor: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Offsets along the node bar, origins shifted against and destinations along the driving side
+    offsets = (circular_distances + 1) / (n_directions + 1) * width_road * driving_side_factor
+    origin_xs = px[origin_index] - cos[origin_index] * offsets
+    origin_ys = py[origin_index] - sin[origin_index] * offsets
+    destination_xs = px[destination_index] + cos[destination_index] * offsets
+    destination_ys = py[destination_index] + sin[destination_index] * offsets
+    return origin_xs, origin_ys, destination_xs, destination_ys
+
+def _compute_edge_geometry(start_xs: np.ndarray, start_ys: np.ndarray,
+                           control_xs: np.ndarray, control_ys: np.ndarray,
+                           end_xs: np.ndarray, end_ys: np.ndarray, curve_resolution: int) -> np.ndarray:
+    # Sample quadratic Bezier curves into polylines of shape (n_curves, curve_resolution, 2) by broadcasting
+    # the (1, curve_resolution) weights against the (n_curves, 1) points
+    t = np.linspace(0.0, 1.0, curve_resolution)[None, :]
+    weights_start, weights_control, weights_end = (1 - t)**2, 2 * (1 - t) * t, t**2
+    xs = weights_start * start_xs[:, None] + weights_control * control_xs[:, None] + weights_end * end_xs[:, None]
+    ys = weights_start * start_ys[:, None] + weights_control * control_ys[:, None] + weights_end * end_ys[:, None]
+    return np.stack([xs, ys], axis=-1)
+
+def _read_only(*arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+    # Cached arrays are shared between instances and must not be modified in place
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+@lru_cache(maxsize=32)
+def _colormap_lut(name: str) -> np.ndarray:
+    # RGBA lookup table holding every entry of a colormap, shared by all instances using it
+    cmap = plt.get_cmap(name)
+    return _read_only(cmap(np.arange(cmap.N)))[0]
+
+@lru_cache(maxsize=32)
+def _compute_node_positions(radius: float, angles_deg: Tuple[float, ...]) -> Tuple[np.ndarray, ...]:
+    # Angles, trig values and node coordinates for compass angles in degrees
+    cartesian_deg = (450.0 - np.array(angles_deg, dtype=np.float64)) % 360.0
+    angles_rad = np.deg2rad(cartesian_deg - 90.0)
+    cos = np.cos(angles_rad)
+    sin = np.sin(angles_rad)
+    # Nodes lie along the connection angle, angle + 90°: cos(angle+90°) = -sin(angle), sin(angle+90°) = cos(angle)
+    return _read_only(angles_rad, cartesian_deg, cos, sin, radius * -sin, radius * cos)
+
+def _compute_control_points(cos: np.ndarray, sin: np.ndarray, connection_angles: np.ndarray,
+                            start_xs: np.ndarray, start_ys: np.ndarray, start_index: np.ndarray,
+                            end_xs: np.ndarray, end_ys: np.ndarray, end_index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Quadratic Bezier control points as in the angle3 connection style: the intersection of the
+    # lines through start and end along the connection angles of their directions, or the midpoint
+    # if they are parallel. The connection angle is angle + 90°, so its trig follows from the cache.
+    cos_a, sin_a = -sin[start_index], cos[start_index]
+    cos_b, sin_b = -sin[end_index], cos[end_index]
+    parallel = (connection_angles[end_index] - connection_angles[start_index]) % 180 == 0
+    determinant = np.where(parallel, 1, sin_b * cos_a - sin_a * cos_b)
+    offset_a = sin_a * start_xs - cos_a * start_ys
+    offset_b = sin_b * end_xs - cos_b * end_ys
+    control_xs = np.where(parallel, (start_xs + end_xs) / 2, (cos_a * offset_b - cos_b * offset_a) / determinant)
+    control_ys = np.where(parallel, (start_ys + end_ys) / 2, (sin_a * offset_b - sin_b * offset_a) / determinant)
+    return control_xs, control_ys
+
+def _circular_distance_matrix(n_directions: int, driving_side_factor: int) -> np.ndarray:
+    # Steps from origin (rows) to destination (columns) around the intersection,
+    # clockwise for right hand traffic and anti clockwise for left hand traffic
+    positions = np.arange(n_directions)
+    return ((positions[None, :] - positions[:, None]) * driving_side_factor % n_directions).astype(np.int32)
+
+@lru_cache(maxsize=32)
+def _compute_bezier_controls(radius: float, angles_deg: Tuple[float, ...], node_index: Tuple[int, ...],
+                             width_road: float, driving_side_factor: int) -> Tuple[np.ndarray, ...]:
+    # Endpoints and control points of the edges between every pair of the given nodes, each of shape (n, n).
+    # They only depend on which directions are in use, not on the traffic volumes.
+    _, connection_angles, cos, sin, px, py = _compute_node_positions(radius, angles_deg)
+    n = len(node_index)
+    origin_index = np.repeat(np.array(node_index), n)
+    destination_index = np.tile(np.array(node_index), n)
+    circular_distances = _circular_distance_matrix(n, driving_side_factor).ravel()
+    origin_xs, origin_ys, destination_xs, destination_ys = _compute_edge_endpoints(
+        px, py, cos, sin, origin_index, destination_index, circular_distances, n, width_road, driving_side_factor)
+    control_xs, control_ys = _compute_control_points(
+        cos, sin, connection_angles,
+        origin_xs, origin_ys, origin_index,
+        destination_xs, destination_ys, destination_index)
+    return _read_only(*(array.reshape(n, n) for array in
+                        (origin_xs, origin_ys, destination_xs, destination_ys, control_xs, control_ys)))
+
+@lru_cache(maxsize=32)
+def _compute_arrow_polygons(radius: float, angles_deg: Tuple[float, ...],
+                            width_road: float, driving_side_factor: int) -> np.ndarray:
+    # Exit arrow triangles of all directions, shape (n_directions, 3, 2)
+    _, _, cos, sin, px, py = _compute_node_positions(radius, angles_deg)
+    road_delta_xs = cos * width_road
+    road_delta_ys = sin * width_road
+    # Rotated by 90°: cos(angle+90°) = -sin(angle), sin(angle+90°) = cos(angle)
+    arrow_middle_delta_xs = road_delta_xs/2 - driving_side_factor*sin
+    arrow_middle_delta_ys = road_delta_ys/2 + driving_side_factor*cos
+    polygons = np.stack([
+        np.stack([px, py], axis=-1),
+        np.stack([px + driving_side_factor*road_delta_xs, py + driving_side_factor*road_delta_ys], axis=-1),
+        np.stack([px + driving_side_factor*arrow_middle_delta_xs, py + driving_side_factor*arrow_middle_delta_ys], axis=-1)
+    ], axis=1)
+    return _read_only(polygons)[0]
+
+class _DirectionTables(NamedTuple):
+    # Per-direction lookup tables, indexed through idx in the order of names
+    names: Tuple[str, ...]
+    idx: Dict[str, int]
+    geometry_key: Tuple[float, Tuple[float, ...]]
+    angles: np.ndarray
+    connection_angles: np.ndarray
+    cos: np.ndarray
+    sin: np.ndarray
+    px: np.ndarray
+    py: np.ndarray
+    xy: np.ndarray  # Node coordinates, shape (n_directions, 2)
+    bar_xy: np.ndarray  # Unit vectors along the node bars, (cos, sin)
+    connection_xy: np.ndarray  # Unit vectors along the connection angles, (-sin, cos)
+    colors: tuple
 
 class Point:
     def __init__(self, x: float, y: float):
@@ -25,6 +160,8 @@ class IntersectionTrafficFlow:
             'NW': 315
             }
 
+    curve_resolution: int = 32
+
     def __init__(self,
                  radius: float = 10,
                  custom_directions: Dict[str, int] = None,
@@ -48,7 +185,8 @@ class IntersectionTrafficFlow:
                  sum_movement_text: bool = True,
                  font_size_sum_movement: int = 10,
                  individual_movement_text: bool = True,
-                 font_size_individual_movement: int = 5):
+                 font_size_individual_movement: int = 5,
+                 min_text_value: float = 0):
         """
         Initializes the IntersectionTrafficFlow visualization class.
 
@@ -75,6 +213,7 @@ class IntersectionTrafficFlow:
         - font_size_sum_movement (int): Font size for sum movement text.
         - individual_movement_text (bool): Whether to display text for individual movements.
         - font_size_individual_movement (int): Font size for individual movement text.
+        - min_text_value (float): Minimum absolute value of a movement to display its text.
         """
     
         
@@ -101,12 +240,22 @@ class IntersectionTrafficFlow:
         self.font_size_sum_movement = font_size_sum_movement
         self.individual_movement_text = individual_movement_text
         self.font_size_individual_movement = font_size_individual_movement
+        self.min_text_value = min_text_value
 
         # Initialization
         self.cartesian_angles = self.calculate_cartesian_angles()
-        self.directions = self.calculate_direction_point()
+        self._directions = None
+        self._prepared_od = None
+        self._plotted_directions = None
+        self._edge_collection = None
+        self._movement_artists = []
+        self._sum_texts = []
+        self._sum_in_first = None
+        self._background = None
+        self._draw_connection = None
         self.ordered_directions = self.order_directions()
         self.colors = self.generate_colors()
+        self._tables = self.build_direction_tables()
 
         # Traffic Settings
         self._left_hand_traffic = left_hand_traffic
@@ -121,24 +270,57 @@ class IntersectionTrafficFlow:
         self._left_hand_traffic = value
         self.driving_side_factor = -1 if value else 1
 
+    @property
+    def directions(self) -> Dict[str, Point]:
+        # Points are only materialized on access, plotting works on the coordinate arrays
+        if self._directions is None:
+            self._directions = self.calculate_direction_point()
+        return self._directions
+
+    @property
+    def cmap_edges_name(self):
+        return self._cmap_edges_name
+
+    @cmap_edges_name.setter
+    def cmap_edges_name(self, value: str):
+        self._cmap_edges_name = value
+        self._edge_lut = _colormap_lut(value) if value is not None else None
+
     def generate_colors(self):
         try:
             cmap = plt.get_cmap(self.cmap_name)
-            return {direction: cmap(i / len(self.directions)) for i, direction in enumerate(self.directions)}
+            return {direction: cmap(i / len(self.compass_direction_angles)) for i, direction in enumerate(self.compass_direction_angles)}
         except ValueError:
             if self.cmap_name in mcolors.CSS4_COLORS or self.cmap_name in mcolors.BASE_COLORS:
-                return {direction: self.cmap_name for direction in self.directions}
+                return {direction: self.cmap_name for direction in self.compass_direction_angles}
             else:
                 raise ValueError(f'{self.cmap_name} not in Matplotlibs cmap or colors')
 
     def calculate_cartesian_angles(self) -> Dict[str, float]:
         return {direction: (450 - angle) % 360 for direction, angle in self.compass_direction_angles.items()}
 
+    def build_direction_tables(self) -> _DirectionTables:
+        # Angles, trig values and node coordinates are shared by all instances with the same geometry
+        names = tuple(self.compass_direction_angles.keys())
+        geometry_key = (float(self.radius), tuple(float(angle) for angle in self.compass_direction_angles.values()))
+        angles_rad, cartesian_deg, cos, sin, px, py = _compute_node_positions(*geometry_key)
+        return _DirectionTables(
+            names=names,
+            idx={direction: i for i, direction in enumerate(names)},
+            geometry_key=geometry_key,
+            angles=angles_rad,
+            connection_angles=cartesian_deg,
+            cos=cos,
+            sin=sin,
+            px=px,
+            py=py,
+            xy=np.stack([px, py], axis=1),
+            bar_xy=np.stack([cos, sin], axis=1),
+            connection_xy=np.stack([-sin, cos], axis=1),
+            colors=tuple(self.colors[direction] for direction in names))
+
     def calculate_direction_point(self):
-        angles_rad = np.deg2rad(list(self.calculate_cartesian_angles().values()))
-        x_coords = self.radius * np.cos(angles_rad)
-        y_coords = self.radius * np.sin(angles_rad)
-        return {direction: Point(x, y) for direction, (x, y) in zip(self.compass_direction_angles.keys(), zip(x_coords, y_coords))}
+        return {direction: Point(x, y) for direction, x, y in zip(self._tables.names, self._tables.px.tolist(), self._tables.py.tolist())}
     
     def order_directions(self):
         return [key for key, _ in sorted(self.compass_direction_angles.items(), key=lambda item: item[1])]
@@ -148,7 +330,8 @@ class IntersectionTrafficFlow:
     def plot(
             self,
             ax: plt.Axes,
-            od_matrix: List[Tuple[str, str, float]]
+            od_matrix: List[Tuple[str, str, float]],
+            directions: List[str] = None
             ) -> plt.Axes:
         """
         Plots the traffic flow visualization on a given Axes.
@@ -156,6 +339,9 @@ class IntersectionTrafficFlow:
         Parameters:
         - ax (plt.Axes): The matplotlib axes object where the visualization will be drawn.
         - od_matrix (List[Tuple[str, str, float]]): A list of tuples representing the origin, destination, and flow magnitude.
+          A NumPy structured array with three fields (origin, destination, value) is accepted as well.
+          With directions given, a square value matrix with origins as rows and destinations as columns.
+        - directions (List[str], optional): The directions of the rows and columns of a value matrix.
 
         Returns:
         - plt.Axes: The axes object with the traffic flow visualization plotted.
@@ -163,315 +349,413 @@ class IntersectionTrafficFlow:
         
         self.ax = ax
 
-        od_matrix = self.sort_od_matrix(od_matrix)
+        # Limits are fixed before any artist is added, so nothing triggers autoscaling
+        self.customize_plot()
+        self._stop_blitting()
 
-        unique_directions = self.get_unique_directions(od_matrix)
+        artists = self._build_artists(od_matrix, directions)
 
-        self.plot_edges(od_matrix, unique_directions)
-        
-        self.plot_nodes(od_matrix, unique_directions)
+        self._install(self.ax, artists)
+        return self.ax
 
-        self.customize_plot()
+    def update(self, od_matrix: List[Tuple[str, str, float]], directions: List[str] = None) -> plt.Axes:
+        """
+        Updates the last plotted visualization with a new OD matrix, reusing its artists.
+
+        Parameters:
+        - od_matrix (List[Tuple[str, str, float]]): A list of tuples representing the origin, destination, and flow magnitude.
+          It has to reference the same directions as the plotted one.
+        - directions (List[str], optional): The directions of the rows and columns of a value matrix, as in plot.
+
+        Returns:
+        - plt.Axes: The axes object with the updated traffic flow visualization.
+        """
+
+        self._update_artists(od_matrix, directions)
+
+        self.ax.figure.canvas.draw_idle()
+        return self.ax
+
+    def blit_update(self, od_matrix: List[Tuple[str, str, float]], directions: List[str] = None) -> plt.Axes:
+        """
+        Updates the last plotted visualization like update, but only redraws the traffic flow on top of a cached
+        background of the static road geometry. Requires a canvas that supports blitting.
+
+        The traffic flow artists are animated from the first call on. Every full redraw of the figure, e.g. after
+        a resize or a DPI change, renews the cached background and draws the traffic flow on top of it.
+
+        Parameters:
+        - od_matrix (List[Tuple[str, str, float]]): A list of tuples representing the origin, destination, and flow magnitude.
+          It has to reference the same directions as the plotted one.
+        - directions (List[str], optional): The directions of the rows and columns of a value matrix, as in plot.
+
+        Returns:
+        - plt.Axes: The axes object with the updated traffic flow visualization.
+        """
+
+        if self._edge_collection is None:
+            raise RuntimeError('plot has to be called before update')
+        canvas = self.ax.figure.canvas
+        if self._draw_connection is None:
+            # Full draws render the static artists only, the background is captured on every one of them
+            for artist in self._flow_artists():
+                artist.set_animated(True)
+            self._draw_connection = (canvas, canvas.mpl_connect('draw_event', self._on_draw))
+            canvas.draw()
+
+        self._update_artists(od_matrix, directions)
+
+        canvas.restore_region(self._background)
+        for artist in self._flow_artists():
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
         return self.ax
     
     # Sub Functions
-    
-    def plot_edges(self, od_matrix: List[Tuple[str, str, float]], unique_directions: List[str]) -> None:
-        edge_width_reduction_factor = self.calculate_edge_width_reduction_factor(od_matrix)
-        min_value, max_value = self.calculate_min_max(od_matrix)
-        if self.cmap_edges_name is not None:
-            self.edge_cmap = plt.get_cmap(self.cmap_edges_name)
-        
-        for (origin, destination, value) in od_matrix:
-            # Get Coordinates and Angle
-            origin_point = self.directions[origin]
-            destination_point = self.directions[destination]
-            origin_angle = self.calculate_angle(origin)
-            destination_angle = self.calculate_angle(destination)
-
-            # Calculate Distance for Sequence of Edges along node bar
-            circular_distance = self.calculate_circular_distance(unique_directions, origin, destination)+1
-
-            # Calculate Offsets along node bar
-            origin_offset = circular_distance/(len(unique_directions)+1) * self.width_road
-            destination_offset = circular_distance/(len(unique_directions)+1) * self.width_road
-            origin_delta_x = np.cos(origin_angle) * self.driving_side_factor * -origin_offset
-            origin_delta_y = np.sin(origin_angle) * self.driving_side_factor * -origin_offset
-            destination_delta_x = np.cos(destination_angle) * self.driving_side_factor * destination_offset
-            destination_delta_y = np.sin(destination_angle) * self.driving_side_factor * destination_offset
-            origin_x = origin_point.x + origin_delta_x
-            origin_y = origin_point.y + origin_delta_y
-            destination_x = destination_point.x + destination_delta_x
-            destination_y = destination_point.y + destination_delta_y
-
-            # Get angle for curved Line
-            angleA = self.get_connection_angles(origin)
-            angleB = self.get_connection_angles(destination)
-
-            # Linewidth
-            linewidth = self.get_linewidth(value, min_value, max_value)
-
-            # Colors
-            if self.cmap_edges_name is None:
-                color = self.colors[origin]
-            else:
-                color = self.get_cmap_color(value, min_value, max_value)
-
-            # Edges
-            if origin == destination:
-                armA = -self.radius*5
-                armB = -self.radius*5
-                self.ax.annotate('',
-                                 xy=(destination_x, destination_y),
-                                 xytext=(origin_x, origin_y),
-                                 arrowprops=dict(arrowstyle="-", connectionstyle=f"arc,angleA={angleA},angleB={angleB},armA={armA},armB={armB},rad={0}",
-                                            color=color, alpha=self.edges_alpha, linewidth=linewidth,
-                                            linestyle='-', capstyle='butt'))
-            elif (angleB - angleA) % 180 == 0:  # If directly opposite
-                self.ax.annotate("",
-                                 xy=(destination_x, destination_y),
-                                 xytext=(origin_x, origin_y),
-                                 arrowprops=dict(arrowstyle="-", color=color, alpha=self.edges_alpha, linewidth=linewidth,
-                                            linestyle='-', capstyle='butt'))
-            else:  # Curved Line
-                self.ax.annotate('',
-                                 xy=(destination_x, destination_y),
-                                 xytext=(origin_x, origin_y),
-                                 arrowprops=dict(arrowstyle="-", connectionstyle=f"angle3,angleA={angleA},angleB={angleB}",
-                                            color=color, alpha=self.edges_alpha, linewidth=linewidth,
-                                            linestyle='-', capstyle='butt'))
-            
-            if self.individual_movement_text:
-            # Individual Movement
-                origin_angle_deg = np.rad2deg(origin_angle)+90
-                if origin_angle_deg < 270 and origin_angle_deg > 90: # If on the left hemisphere
-                    text_angle_deg = origin_angle_deg - 180
-                    ha = 'right'
-                    va = 'center'
-                else:   # If on the right hemisphere
-                    text_angle_deg = origin_angle_deg
-                    ha = 'left'
-                    va = 'center'
-                self.ax.text(x=origin_x, y=origin_y, s=f'{value}', # Small Text with traffic volume
-                            fontsize=self.font_size_individual_movement, rotation=text_angle_deg, rotation_mode='anchor',
-                            horizontalalignment=ha, verticalalignment=va)
-            
-    def plot_nodes(self, od_matrix: List[Tuple[str, str, float]], unique_directions: List[str]) -> None:
-        origin_sums, destination_sums = self.sum_values_by_origin_and_destination(od_matrix)
-
-        self.roadside_anchors: Dict = {}
-        for key in unique_directions:
-            # Get Coordinates and Angle
-            point = self.directions[key]
-            angle = self.calculate_angle(key)
-            angle_deg = np.rad2deg(angle)
-
-            # Crossbar
-            road_delta_x = np.cos(angle) * self.width_road
-            road_delta_y = np.sin(angle) * self.width_road
-            if self.crossbar:
-                crossbar = Line2D(
-                    [point.x - road_delta_x, point.x + road_delta_x],
-                    [point.y - road_delta_y, point.y + road_delta_y],
-                    color=self.colors[key],
-                    linewidth=self.width_crossbar,
-                    alpha=self.nodes_alpha,
-                    solid_capstyle='butt'
-                )
-                self.ax.add_line(crossbar)
-            
-            # Exit Arrow
-            if self.exit_arrow:
-                arrow_middle_delta_x = road_delta_x/2 + np.cos(angle+np.deg2rad(self.driving_side_factor*90))
-                arrow_middle_delta_y = road_delta_y/2 + np.sin(angle+np.deg2rad(self.driving_side_factor*90))
-                triangle = patches.Polygon(
-                    [
-                        [point.x, point.y],
-                        [point.x + self.driving_side_factor*road_delta_x, point.y + self.driving_side_factor*road_delta_y],
-                        [point.x + self.driving_side_factor*arrow_middle_delta_x, point.y + self.driving_side_factor*arrow_middle_delta_y]
-                    ],
-                    closed=True,
-                    edgecolor=self.colors[key],
-                    facecolor=self.colors[key],
-                    alpha=self.nodes_alpha
-                )
-                self.ax.add_patch(triangle)
 
+    def _on_draw(self, event) -> None:
+        # Saving already draws animated artists, and into another renderer than the cached background
+        if event.canvas.is_saving():
+            return
+        self._background = event.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._flow_artists():
+            self.ax.draw_artist(artist)
+
+    def _stop_blitting(self) -> None:
+        if self._draw_connection is not None:
+            canvas, connection_id = self._draw_connection
+            canvas.mpl_disconnect(connection_id)
+        self._draw_connection = None
+        self._background = None
+
+    def _build_artists(self, od_matrix: List[Tuple[str, str, float]], directions: List[str] = None) -> List[Artist]:
+        # Artists are built without an Axes and can be installed on any one of them. Matplotlib artists
+        # cannot be shared between Axes, so the prepared OD data of the last call is reused instead.
+        od_matrix, unique_directions = self._prepare_od(od_matrix, directions)
+        self._plotted_directions = unique_directions
+
+        return self.plot_edges(od_matrix, unique_directions) + self.plot_nodes(od_matrix, unique_directions)
+
+    def _prepare_od(self, od_matrix: List[Tuple[str, str, float]], directions: List[str] = None) -> Tuple[List[Tuple[str, str, float]], List[str]]:
+        if directions is not None:
+            # Value matrix, compared by its raw bytes
+            od_matrix = np.asarray(od_matrix)
+            if od_matrix.shape != (len(directions), len(directions)):
+                raise ValueError(f'Value matrix of shape {od_matrix.shape} does not match {len(directions)} directions')
+            key = (tuple(directions), od_matrix.dtype.str, od_matrix.tobytes())
+        else:
+            if isinstance(od_matrix, np.ndarray):
+                # Structured array records become plain (origin, destination, value) tuples in one call
+                od_matrix = od_matrix.tolist()
+            key = tuple(od_matrix)
+        if self._prepared_od is None or self._prepared_od[0] != key:
+            if directions is not None:
+                sorted_od_matrix = self.sort_value_matrix(directions, od_matrix)
+            else:
+                sorted_od_matrix = self.sort_od_matrix(od_matrix)
+            self._prepared_od = (key, sorted_od_matrix, self.get_unique_directions(sorted_od_matrix))
+        _, sorted_od_matrix, unique_directions = self._prepared_od
+        return sorted_od_matrix, unique_directions
+
+    def _update_artists(self, od_matrix: List[Tuple[str, str, float]], directions: List[str] = None) -> None:
+        if self._edge_collection is None:
+            raise RuntimeError('plot has to be called before update')
+        od_matrix, unique_directions = self._prepare_od(od_matrix, directions)
+        if unique_directions != self._plotted_directions:
+            raise ValueError(f'Directions {unique_directions} differ from the plotted {self._plotted_directions}, use plot instead')
+
+        # Edges are reset in place, only U-turns and movement labels are rebuilt
+        for artist in self._movement_artists:
+            artist.remove()
+        artists = self.plot_edges(od_matrix, unique_directions, self._edge_collection)
+        if self._draw_connection is not None:
+            for artist in artists:
+                artist.set_animated(True)
+        self._install(self.ax, artists)
+        for text, sum_text in zip(self._sum_texts, self.format_sum_texts(od_matrix, unique_directions, self._sum_in_first)):
+            text.set_text(sum_text)
+
+    def _flow_artists(self) -> List[Artist]:
+        # Artists that change with the OD matrix
+        return [self._edge_collection] + self._movement_artists + self._sum_texts
+
+    def _install(self, ax: plt.Axes, artists: List[Artist]) -> None:
+        for artist in artists:
+            ax.add_artist(artist)
+    
+    def plot_edges(self,
+                   od_matrix: List[Tuple[str, str, float]],
+                   unique_directions: List[str],
+                   edge_collection: LineCollection = None) -> List[Artist]:
+        # An edge collection of an earlier call is reset in place and not returned again
+        tables = self._tables
+        new_collection = edge_collection is None
+        if new_collection:
+            edge_collection = LineCollection([], alpha=self.edges_alpha, linestyle='-', capstyle='butt', zorder=3)
+        self._edge_collection = edge_collection
+        self._movement_artists = []
+
+        # Values keep the dtype of the OD matrix, so labels read as the input
+        values = np.asarray([value for _, _, value in od_matrix])
+        min_value, max_value = self.calculate_min_max(values)
+
+        # Movements without traffic are neither drawn nor labeled
+        has_traffic = values != 0
+        od_matrix = [edge for edge, keep in zip(od_matrix, has_traffic) if keep]
+        values = values[has_traffic]
+        if not od_matrix:
+            edge_collection.set_segments([])
+            return [edge_collection] if new_collection else []
+
+        # Edge arrays, the dense OD matrix is sorted row-major by the unique directions
+        node_index = np.array([tables.idx[direction] for direction in unique_directions])
+        origin_position, destination_position = np.divmod(np.flatnonzero(has_traffic), len(unique_directions))
+        origin_index = node_index[origin_position]
+        destination_index = node_index[destination_position]
+
+        # Offsets along node bar and control points are cached per set of directions
+        origin_xs, origin_ys, destination_xs, destination_ys, control_xs, control_ys = (
+            grid[origin_position, destination_position] for grid in _compute_bezier_controls(
+                *tables.geometry_key, tuple(node_index.tolist()), float(self.width_road), self.driving_side_factor))
+
+        # Linewidth
+        linewidths = self.calculate_linewidths(values, min_value, max_value)
+
+        # Colors
+        if self.cmap_edges_name is None:
+            colors = mcolors.to_rgba_array(tables.colors)[origin_index]
+        else:
+            colors = self.get_cmap_color(values, min_value, max_value)
+
+        # Edges as sampled quadratic Bezier curves, straight between directly opposite directions
+        segments = self.calculate_bezier_segments(origin_xs, origin_ys, control_xs, control_ys, destination_xs, destination_ys)
+        u_turns = origin_index == destination_index
+        through = ~u_turns
+
+        artists = []
+        for edge in np.flatnonzero(u_turns):
+            angle = tables.connection_angles[origin_index[edge]]
+            armA = -self.radius*5
+            armB = -self.radius*5
+            artists.append(Annotation('',
+                                      xy=(destination_xs[edge], destination_ys[edge]),
+                                      xytext=(origin_xs[edge], origin_ys[edge]),
+                                      arrowprops=dict(arrowstyle="-", connectionstyle=f"arc,angleA={angle},angleB={angle},armA={armA},armB={armB},rad={0}",
+                                                 color=colors[edge], alpha=self.edges_alpha, linewidth=linewidths[edge],
+                                                 linestyle='-', capstyle='butt')))
+
+        # All other edges share one collection with per-segment colors and widths
+        edge_collection.set_segments(segments[through])
+        edge_collection.set_color(colors[through])
+        edge_collection.set_linewidths(linewidths[through])
+        self._movement_artists.extend(artists)
+        if new_collection:
+            artists.append(edge_collection)
+
+        if self.individual_movement_text:
+            # Individual Movement, only for movements reaching the text threshold
+            font_size = self.font_size_individual_movement
+            labeled = np.abs(values) >= self.min_text_value
+            origin_angles_deg = np.rad2deg(tables.angles[origin_index[labeled]])+90
+            left_hemisphere = (origin_angles_deg < 270) & (origin_angles_deg > 90)
+            text_angles_deg = np.where(left_hemisphere, origin_angles_deg - 180, origin_angles_deg)
+            horizontal_alignments = np.where(left_hemisphere, 'right', 'left')
+            labels = zip(origin_xs[labeled], origin_ys[labeled], values[labeled].astype(str), text_angles_deg, horizontal_alignments)
+            label_artists = [Text(x=origin_x, y=origin_y, text=label, # Small Text with traffic volume
+                                  fontsize=font_size, rotation=text_angle_deg, rotation_mode='anchor',
+                                  horizontalalignment=ha, verticalalignment='center', clip_on=False)
+                             for origin_x, origin_y, label, text_angle_deg, ha in labels]
+            self._movement_artists.extend(label_artists)
+            artists.extend(label_artists)
+
+        return artists
+
+    def plot_nodes(self, od_matrix: List[Tuple[str, str, float]], unique_directions: List[str]) -> List[Artist]:
+        artists = []
+        tables = self._tables
+
+        # Text rotation for all nodes, labels on the lower hemisphere are flipped to stay readable
+        node_index = np.array([tables.idx[key] for key in unique_directions])
+        angles_deg = np.rad2deg(tables.angles[node_index])
+        lower_hemisphere = (angles_deg < 270) & (angles_deg > 90)
+        text_angles_deg = np.where(lower_hemisphere, angles_deg - 180, angles_deg)
+        # Inflow is written first on the lower hemisphere for left hand traffic and on the upper one otherwise
+        sum_in_first = lower_hemisphere == self.left_hand_traffic
+        self._sum_in_first = sum_in_first
+        self._sum_texts = []
+        sum_texts = self.format_sum_texts(od_matrix, unique_directions, sum_in_first) if self.sum_movement_text else [None] * len(unique_directions)
+
+        # Node geometry for all nodes at once, the connection vectors point away from the center
+        node_xy = tables.xy[node_index]
+        connection_xy = tables.connection_xy[node_index]
+        node_colors = [tables.colors[i] for i in node_index]
+        direction_text_xy = node_xy + connection_xy * self.text_offset
+        sum_movement_xy = node_xy + connection_xy * self.text_offset / 2
+
+        for key, color, text_angle_deg, sum_text, (text_x, text_y), (sum_movment_x, sum_movment_y) in zip(
+                unique_directions, node_colors, text_angles_deg, sum_texts, direction_text_xy, sum_movement_xy):
             # Text of Direction
             if self.direction_text:
-                if angle_deg < 270 and angle_deg > 90: # If on the lower hemisphere
-                    text_angle_deg = angle_deg - 180
-                else:   # If on the upper hemisphere
-                    text_angle_deg = angle_deg
-                text_x = point.x + np.cos(angle+np.deg2rad(90)) * self.text_offset
-                text_y = point.y + np.sin(angle+np.deg2rad(90)) * self.text_offset
-                self.ax.text(x=text_x, y=text_y, s=key, color=self.colors[key], rotation=text_angle_deg,
-                            fontsize=self.font_size_direction,
-                            ha='center', va='center')
-
-            # Centerline
-            if self.centerline:
-                centerline_delta_x = np.cos(angle+np.deg2rad(90))*2
-                centerline_delta_y = np.sin(angle+np.deg2rad(90))*2
-                self.ax.plot([point.x - centerline_delta_x, point.x],
-                            [point.y - centerline_delta_y, point.y],
-                            color='black', linewidth=2, linestyle='--') # Bar
-                
-            # Roadside collect data
-            if self.roadside:
-                right_side_anchor = Point(point.x - road_delta_x, point.y - road_delta_y)
-                left_side_anchor = Point(point.x + road_delta_x, point.y + road_delta_y)
-                connection_angle = self.get_connection_angles(key)
-                self.roadside_anchors[key] = {'right': (right_side_anchor, connection_angle), 'left': (left_side_anchor, connection_angle)}
+                artists.append(Text(x=text_x, y=text_y, text=key, color=color, rotation=text_angle_deg,
+                                    fontsize=self.font_size_direction,
+                                    ha='center', va='center', clip_on=False))
 
             # Sum of Movment
             if self.sum_movement_text:
-                sum_out_text = f'∑ out: {destination_sums[key]}'
-                sum_in_text = f'∑ in: {origin_sums[key]}'
-                if angle_deg < 270 and angle_deg > 90: # If on the lower hemisphere
-                    text_angle_deg = angle_deg - 180
-                    if self.left_hand_traffic:
-                        sum_text = '  ' + sum_in_text + ' | ' + sum_out_text
-                    else:
-                        sum_text = sum_out_text + ' | ' + sum_in_text + '  '
-                else:   # If on the upper hemisphere
-                    text_angle_deg = angle_deg
-                    if self.left_hand_traffic:
-                        sum_text = sum_out_text + ' | ' + sum_in_text + '  '
-                    else:
-                        sum_text = '  ' + sum_in_text + ' | ' + sum_out_text
-                sum_movment_x = point.x + np.cos(angle+np.deg2rad(90)) * self.text_offset / 2
-                sum_movment_y = point.y + np.sin(angle+np.deg2rad(90)) * self.text_offset / 2
-                
-                self.ax.text(x=sum_movment_x, y=sum_movment_y, s=sum_text, rotation=text_angle_deg,
-                            fontsize=self.font_size_sum_movement,
-                            horizontalalignment='center', verticalalignment='center')
+                self._sum_texts.append(Text(x=sum_movment_x, y=sum_movment_y, text=sum_text, rotation=text_angle_deg,
+                                            fontsize=self.font_size_sum_movement,
+                                            horizontalalignment='center', verticalalignment='center', clip_on=False))
+                artists.append(self._sum_texts[-1])
         
+        # Node artists batched into collections
+        if self.crossbar:
+            road_deltas = tables.bar_xy[node_index] * self.width_road
+            crossbar_segments = np.stack([node_xy - road_deltas, node_xy + road_deltas], axis=1)
+            artists.append(LineCollection(crossbar_segments, colors=node_colors, linewidths=self.width_crossbar,
+                                          alpha=self.nodes_alpha, capstyle='butt', zorder=2))
+        if self.exit_arrow:
+            arrow_vertices = _compute_arrow_polygons(*tables.geometry_key, float(self.width_road), self.driving_side_factor)[node_index]
+            artists.append(PolyCollection(arrow_vertices, closed=True, facecolors=node_colors,
+                                          edgecolors=node_colors, alpha=self.nodes_alpha, zorder=1))
+        if self.centerline:
+            centerline_segments = np.stack([node_xy - connection_xy * 2, node_xy], axis=1)
+            artists.append(LineCollection(centerline_segments, colors='black', linewidths=2,
+                                          linestyle='--', zorder=2)) # Bar
+
         if self.roadside:
-            for i, key in enumerate(unique_directions):
-                i_next = (i+1) % len(unique_directions)
-                left_side_anchor_point_current = self.roadside_anchors[key]['left'][0]
-                right_side_anchor_point_next = self.roadside_anchors[unique_directions[i_next]]['right'][0]
-                left_side_anchor_angle_current = self.roadside_anchors[key]['left'][1]
-                right_side_anchor_angle_next = self.roadside_anchors[unique_directions[i_next]]['right'][1]
-                # Roadside
-                if (right_side_anchor_angle_next - left_side_anchor_angle_current) % 180 == 0:  # If directly opposite
-                    self.ax.annotate("",
-                                    xy=(right_side_anchor_point_next.x, right_side_anchor_point_next.y),
-                                    xytext=(left_side_anchor_point_current.x, left_side_anchor_point_current.y),
-                                                arrowprops=dict(arrowstyle="-", color='black', alpha=1, linewidth=2,
-                                                    linestyle='-', capstyle='butt'))
-                else:  # Curved Line
-                    self.ax.annotate('',
-                                    xy=(right_side_anchor_point_next.x, right_side_anchor_point_next.y),
-                                    xytext=(left_side_anchor_point_current.x, left_side_anchor_point_current.y),
-                                    arrowprops=dict(arrowstyle="-",
-                                                    connectionstyle=f"angle3,angleA={left_side_anchor_angle_current},angleB={right_side_anchor_angle_next}",
-                                                    color='black', alpha=1, linewidth=2,
-                                                    linestyle='-', capstyle='butt'))
-               
+            # Roadside from the left anchor of each node to the right anchor of the next one, drawn as one path
+            next_index = np.roll(node_index, -1)
+            left_side_anchor_xs, left_side_anchor_ys = (tables.xy[node_index] + tables.bar_xy[node_index] * self.width_road).T
+            right_side_anchor_next_xs, right_side_anchor_next_ys = (tables.xy[next_index] - tables.bar_xy[next_index] * self.width_road).T
+            control_xs, control_ys = self.calculate_control_points(
+                left_side_anchor_xs, left_side_anchor_ys, node_index,
+                right_side_anchor_next_xs, right_side_anchor_next_ys, next_index)
+            vertices = np.stack([left_side_anchor_xs, left_side_anchor_ys,
+                                 control_xs, control_ys,
+                                 right_side_anchor_next_xs, right_side_anchor_next_ys], axis=1).reshape(-1, 2)
+            codes = np.tile([Path.MOVETO, Path.CURVE3, Path.CURVE3], len(node_index))
+            artists.append(PathPatch(Path(vertices, codes), facecolor='none', edgecolor='black', linewidth=2,
+                                     linestyle='-', capstyle='butt', zorder=3))
+
+        return artists
+
     # Helper Functions
+
+    def format_sum_texts(self, od_matrix: List[Tuple[str, str, int]], unique_directions: List[str], sum_in_first: np.ndarray) -> List[str]:
+        origin_sums, destination_sums = self.sum_values_by_origin_and_destination(od_matrix, unique_directions)
+        sum_texts = []
+        for key, in_first in zip(unique_directions, sum_in_first):
+            sum_out_text = f'∑ out: {destination_sums[key]}'
+            sum_in_text = f'∑ in: {origin_sums[key]}'
+            if in_first:
+                sum_texts.append('  ' + sum_in_text + ' | ' + sum_out_text)
+            else:
+                sum_texts.append(sum_out_text + ' | ' + sum_in_text + '  ')
+        return sum_texts
     
     def get_unique_directions(self, od_matrix: List[Tuple[str, str, int]]) -> List[str]:
-        unique_directions_dict = OrderedDict()
-        for origin, destination, _ in od_matrix:
-            unique_directions_dict[origin] = None
+        referenced_directions = set()
         for origin, destination, _ in od_matrix:
-            unique_directions_dict[destination] = None
-        unique_directions = list(unique_directions_dict.keys())
-        return unique_directions
+            referenced_directions.add(origin)
+            referenced_directions.add(destination)
+        return [direction for direction in self.ordered_directions if direction in referenced_directions]
     
+    def calculate_dense_od_matrix(self, od_matrix: List[Tuple[str, str, int]]) -> Tuple[List[str], np.ndarray]:
+        directions = self.get_unique_directions(od_matrix)
+        direction_index = {direction: index for index, direction in enumerate(directions)}
+        values = np.asarray([value for _, _, value in od_matrix])
+        # Dense matrix in direction order, missing pairs stay zero
+        dense_od_matrix = np.zeros((len(directions), len(directions)), dtype=values.dtype)
+        for (origin, destination, _), value in zip(od_matrix, values):
+            dense_od_matrix[direction_index[origin], direction_index[destination]] = value
+        return directions, dense_od_matrix
+
     def sort_od_matrix(self, od_matrix: List[Tuple[str, str, int]]) -> List[Tuple[str, str, int]]:
-        directions = set()
-        for origin, destination, _ in od_matrix:
-            directions.add(origin)
-            directions.add(destination)
-        complete_od_matrix = defaultdict(int)
-        for origin in directions:
-            for destination in directions:
-                complete_od_matrix[(origin, destination)] = 0
-        for origin, destination, value in od_matrix:
-            complete_od_matrix[(origin, destination)] = value
-        completed_od_matrix = [(origin, destination, value) for (origin, destination), value in complete_od_matrix.items()]
-        direction_index = {direction: index for index, direction in enumerate(self.ordered_directions)}
-        return sorted(completed_od_matrix, key=lambda x: (direction_index[x[0]], direction_index[x[1]]))
-
-    def calculate_min_max(self, od_matrix: List[Tuple[str, str, int]]) -> List[Tuple[float, float]]:
-        values = [value for _, _, value in od_matrix]
-        min_value = min(values)
-        max_value = max(values)
+        directions, dense_od_matrix = self.calculate_dense_od_matrix(od_matrix)
+        return self.flatten_dense_od_matrix(directions, dense_od_matrix)
+
+    def sort_value_matrix(self, directions: List[str], value_matrix: np.ndarray) -> List[Tuple[str, str, int]]:
+        # Rows and columns reordered to the order of the directions, without going through tuples
+        if len(set(directions)) != len(directions):
+            raise ValueError(f'Duplicate directions in {directions}')
+        position = {direction: i for i, direction in enumerate(directions)}
+        unknown_directions = set(position) - set(self.ordered_directions)
+        if unknown_directions:
+            raise ValueError(f'Unknown directions {sorted(unknown_directions)}')
+        ordered = [direction for direction in self.ordered_directions if direction in position]
+        order = [position[direction] for direction in ordered]
+        return self.flatten_dense_od_matrix(ordered, value_matrix[np.ix_(order, order)])
+
+    def flatten_dense_od_matrix(self, directions: List[str], dense_od_matrix: np.ndarray) -> List[Tuple[str, str, int]]:
+        return [(origin, destination, value)
+                for origin, row in zip(directions, dense_od_matrix.tolist())
+                for destination, value in zip(directions, row)]
+
+    def calculate_min_max(self, values: np.ndarray) -> Tuple[float, float]:
+        min_value = values.min()
+        max_value = values.max()
         if self.cmap_edges_center:
             max_abs = max(abs(min_value), abs(max_value))
             min_value = -max_abs
             max_value = max_abs
         return min_value, max_value
 
-    def calculate_edge_width_reduction_factor(self, od_matrix: List[Tuple[str, str, float]]) -> None:
-        max_value = max(value for _, _, value in od_matrix)
-        return max_value / self.max_edge_width
-    
-    def get_linewidth(self, value: float, min_value: float, max_value: float) -> int:
+    def calculate_linewidths(self, values: np.ndarray, min_value: float, max_value: float) -> np.ndarray:
+        if max_value == min_value:  # Uniform values, no scaling needed
+            return np.full(np.shape(values), (self.min_edge_width + self.max_edge_width) / 2)
         scale = (self.max_edge_width - self.min_edge_width) / (max_value - min_value)
         if self.cmap_edges_center:
-            edge_width = self.min_edge_width + (abs(value) - min_value) * scale
-        else:
-            edge_width = self.min_edge_width + (value - min_value) * scale
-        return edge_width
+            values = np.abs(values)
+        return self.min_edge_width + (values - min_value) * scale
 
-        
     def calculate_angle(self, key: str) -> float:
-        return np.deg2rad(self.cartesian_angles[key]-90)
+        return self._tables.angles[self._tables.idx[key]]
 
     def get_connection_angles(self, key: str) -> int:
-        angle = self.cartesian_angles[key]
-        return angle
-
-    def calculate_circular_distance(self, directions: List[str], origin: str, destination: str):
-        start_index = directions.index(origin)
-        end_index = directions.index(destination)
-        
-        if self.driving_side_factor == 1:  # Clockwise
-            if end_index >= start_index:
-                distance = end_index - start_index
-            else:
-                distance = len(directions) - start_index + end_index
-        elif self.driving_side_factor == -1:  # Anti Clockwise
-            if start_index >= end_index:
-                distance = start_index - end_index
-            else:
-                distance = len(directions) - end_index + start_index
-        
-        return distance 
-
-    def sum_values_by_origin_and_destination(self, od_matrix: List[Tuple[str, str, int]]) -> Tuple[Dict[str, int], Dict[str, int]]:
-        origin_sums = {}
-        destination_sums = {}
-        
-        for origin, destination, value in od_matrix:
-            if origin in origin_sums:
-                origin_sums[origin] += value
-            else:
-                origin_sums[origin] = value
-            
-            if destination in destination_sums:
-                destination_sums[destination] += value
-            else:
-                destination_sums[destination] = value
-                
+        return self.cartesian_angles[key]
+
+    def calculate_control_points(self,
+                                 start_xs: np.ndarray, start_ys: np.ndarray, start_index: np.ndarray,
+                                 end_xs: np.ndarray, end_ys: np.ndarray, end_index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        tables = self._tables
+        return _compute_control_points(tables.cos, tables.sin, tables.connection_angles,
+                                       start_xs, start_ys, start_index,
+                                       end_xs, end_ys, end_index)
+
+    def calculate_bezier_segments(self,
+                                  start_xs: np.ndarray, start_ys: np.ndarray,
+                                  control_xs: np.ndarray, control_ys: np.ndarray,
+                                  end_xs: np.ndarray, end_ys: np.ndarray) -> np.ndarray:
+        return _compute_edge_geometry(start_xs, start_ys, control_xs, control_ys, end_xs, end_ys, self.curve_resolution)
+
+    def calculate_circular_distance(self, directions: List[str], origin: str, destination: str) -> int:
+        distances = _circular_distance_matrix(len(directions), self.driving_side_factor)
+        return int(distances[directions.index(origin), directions.index(destination)])
+
+    def sum_values_by_origin_and_destination(self, od_matrix: List[Tuple[str, str, int]], directions: List[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        # The sorted OD matrix is dense and row-major in the order of the directions, so it reshapes into the dense matrix
+        dense_od_matrix = np.asarray([value for _, _, value in od_matrix]).reshape(len(directions), len(directions))
+        origin_sums = dict(zip(directions, dense_od_matrix.sum(axis=1).tolist()))
+        destination_sums = dict(zip(directions, dense_od_matrix.sum(axis=0).tolist()))
         return origin_sums, destination_sums
     
     # Styling Functions
 
     def get_cmap_color(self, value: float, min_value: int, max_value: int):
-        normalized = (value - min_value) / (max_value - min_value)
-        return self.edge_cmap(normalized)
+        if max_value == min_value:  # Uniform values map to the center of the colormap
+            normalized = np.full(np.shape(value), 0.5)
+        else:
+            normalized = (value - min_value) / (max_value - min_value)
+        # Colors are gathered from the lookup table, binned like the colormap itself
+        n_colors = len(self._edge_lut)
+        return self._edge_lut[np.minimum((normalized * n_colors).astype(int), n_colors - 1)]
 
     def customize_plot(self) -> None:
         lim = int(self.radius*1.5)
+        self.ax.set_autoscale_on(False)
         self.ax.set_xlim([-lim, lim])
         self.ax.set_ylim([-lim, lim])
-        self.ax.grid(True)
-        self.ax.axis('off')
+        self.ax.set_axis_off()
         self.ax.set_aspect('equal', adjustable='box')
 
 
@@ -482,20 +766,21 @@ if __name__ == '__main__':
     itf = IntersectionTrafficFlow(
         custom_directions=None)
     
-    fig, axs = plt.subplots(nrows=1, ncols=2, figsize=(12, 15))
+    fig, axs = plt.subplots(nrows=1, ncols=2, figsize=(12, 15), sharex=True, sharey=True)
     
     '''directions = ['N', 'S', 'W']'''
     '''directions = ['N', 'E', 'S', 'W']'''
     '''directions = ['N', 'NE', 'E', 'S', 'SW', 'NW']'''
     directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
     '''directions = list(custom_directions.keys())'''
-    for ax in axs.flat:
-        max_val = 1000
-        min_val = 0
-        od_matrix = []
-        for origin in directions:
-            for destination in directions:
-                od_matrix.append((origin, destination, random.randint(min_val, max_val)))
+    max_val = 1000
+    min_val = 0
+    rng = np.random.default_rng()
+    values = rng.integers(min_val, max_val + 1, size=(axs.size, len(directions), len(directions)))
+    for ax, vals in zip(axs.flat, values):
+        od_matrix = [(origin, destination, int(vals[i, j]))
+                     for i, origin in enumerate(directions)
+                     for j, destination in enumerate(directions)]
 
         '''od_matrix = [('N', 'N', 60), ('N', 'E', 696), ('N', 'S', 671), ('N', 'SW', 921), ('N', 'NW', 368),
                      ('NE', 'N', 498), ('NE', 'E', 61), ('NE', 'S', 665), ('NE', 'SW', 425), ('NE', 'NW', 469),
@@ -1,10 +1,34 @@
+# Renders four example intersections into multi_example.png.
+# The figure is only saved, so the non-interactive Agg backend is used by default.
+# Set the SHOW environment variable or pass --show to open it in a TkAgg window instead.
 import os
-import random
+import sys
+import matplotlib
+SHOW = bool(os.environ.get('SHOW')) or '--show' in sys.argv[1:]
+matplotlib.use('TkAgg' if SHOW else 'Agg')
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import numpy as np
 from IntersectionTrafficFlow import IntersectionTrafficFlow
 
-fig, axs = plt.subplots(nrows=2, ncols=2, figsize=(20,20))
-plt.tight_layout()
+
+# Set the SEED environment variable for reproducible OD matrices
+rng = np.random.default_rng(int(os.environ['SEED']) if 'SEED' in os.environ else None)
+
+
+def make_value_matrices(ranges, n_max, rng):
+    # Random values for all intersections in one draw, scaled to each (lo, hi) range.
+    # U-turns on the diagonal get a fifth of the value range.
+    lo, hi = np.array(ranges).T[:, :, None, None]
+    vals = np.floor(lo + rng.random((len(ranges), n_max, n_max)) * (hi - lo + 1)).astype(np.int32)
+    diagonal = np.arange(n_max)
+    vals[:, diagonal, diagonal] //= 5
+    return vals
+
+
+# Output resolution, set the DPI environment variable for print quality (e.g. DPI=300)
+DPI = int(os.environ.get('DPI', 100))
+
 
 # First Intersection
 custom_1 = {'High Street': 0, 'Kings Road': 240, 'Park Avenue': 60, 'Main Street': 195, 'Green Lane': 300}
@@ -35,18 +59,6 @@ itf_1 = IntersectionTrafficFlow(
 
 directions_1 = list(custom_1.keys())
 
-max_val = 1000
-min_val = 0
-od_matrix = []
-for origin in directions_1:
-    for destination in directions_1:
-        if origin == destination:
-            od_matrix.append((origin, destination, random.randint(min_val, max_val/5)))
-        else:
-            od_matrix.append((origin, destination, random.randint(min_val, max_val)))
-
-itf_1.plot(axs.flat[0], od_matrix)
-
 # Second Intersection
 itf_2 = IntersectionTrafficFlow(
     radius = 10,
@@ -75,18 +87,6 @@ itf_2 = IntersectionTrafficFlow(
 
 directions_2 = ['N', 'NE', 'E', 'S', 'SW', 'NW']
 
-max_val = 1000
-min_val = 0
-od_matrix = []
-for origin in directions_2:
-    for destination in directions_2:
-        if origin == destination:
-            od_matrix.append((origin, destination, random.randint(min_val, max_val/5)))
-        else:
-            od_matrix.append((origin, destination, random.randint(min_val, max_val)))
-
-itf_2.plot(axs.flat[1], od_matrix)
-
 
 # Third Intersection
 itf_3 = IntersectionTrafficFlow(
@@ -116,18 +116,6 @@ itf_3 = IntersectionTrafficFlow(
 
 directions_3 = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
 
-max_val = 1000
-min_val = 0
-od_matrix = []
-for origin in directions_3:
-    for destination in directions_3:
-        if origin == destination:
-            od_matrix.append((origin, destination, random.randint(min_val, max_val/5)))
-        else:
-            od_matrix.append((origin, destination, random.randint(min_val, max_val)))
-
-itf_3.plot(axs.flat[2], od_matrix)
-
 
 # Fourth Intersection
 custom_4 = {'Sunset Boulevard': 0, 'River Road': 90, 'Orchard Lane': 180, 'Cedar Avenue': 270}
@@ -158,20 +146,29 @@ itf_4 = IntersectionTrafficFlow(
 
 directions_4 = list(custom_4.keys())
 
-max_val = 100
-min_val = -100
-od_matrix = []
-for origin in directions_4:
-    for destination in directions_4:
-        if origin == destination:
-            od_matrix.append((origin, destination, random.randint(min_val/5, max_val/5)))
-        else:
-            od_matrix.append((origin, destination, random.randint(min_val, max_val)))
-
-itf_4.plot(axs.flat[3], od_matrix)
-
-# Save plot
-script_dir = os.path.dirname(__file__)
-output_path = os.path.join(script_dir, 'multi_example.png')
-fig.savefig(output_path, dpi=300)
-plt.show()
\ No newline at end of file
+
+if __name__ == '__main__':
+    intersections = [itf_1, itf_2, itf_3, itf_4]
+    directions = [directions_1, directions_2, directions_3, directions_4]
+    value_matrices = make_value_matrices([(0, 1000), (0, 1000), (0, 1000), (-100, 100)],
+                                         max(map(len, directions)), rng)
+
+    # Bare axes tiled over the figure, the intersections bring their own layout so no ticks or spines are needed.
+    # Only a figure that is shown has to be managed by pyplot.
+    fig = plt.figure(figsize=(20,20)) if SHOW else Figure(figsize=(20,20))
+    axs = [fig.add_axes([x, y, 0.5, 0.5], xticks=[], yticks=[], frameon=False)
+           for x, y in [(0, 0.5), (0.5, 0.5), (0, 0), (0.5, 0)]]
+
+    # The top left corner of each value matrix is plotted directly, rows are origins and columns destinations
+    for i, (itf, directions_i, vals) in enumerate(zip(intersections, directions, value_matrices)):
+        n = len(directions_i)
+        itf.plot(axs[i], vals[:n, :n], directions=directions_i)
+
+    # Save plot
+    script_dir = os.path.dirname(__file__)
+    output_path = os.path.join(script_dir, 'multi_example.png')
+    # Fast zlib level and no Software text chunk, the image is rewritten on every run
+    fig.savefig(output_path, dpi=DPI, metadata={'Software': None},
+                pil_kwargs={'optimize': False, 'compress_level': 1})
+    if SHOW:
+        plt.show()
\ No newline at end of file
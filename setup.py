@@ -1,19 +1,26 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
+readme = Path(__file__).with_name('ReadMe.md')
+long_description = readme.read_text(encoding='utf-8') if readme.exists() else ''
+
 setup(
     name="IntersectionTrafficFlow",
     version="0.1.0",
     description="Visualize traffic flow at intersections",
-    long_description=open('README.md').read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     author="Severin Hitz",
     author_email="sevihitz@gmail.com",
     url="https://github.com/SeverinHitz/IntersectionTrafficFlow",
     packages=find_packages(),
     install_requires=[
-        'matplotlib',
-        'numpy'
+        'matplotlib>=3.3',
+        'numpy>=1.19'
     ],
+    extras_require={
+        'numba': ['numba']
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'License :: OSI Approved :: MIT License',
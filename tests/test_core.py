@@ -0,0 +1,88 @@
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.text import Annotation
+from IntersectionTrafficFlow import IntersectionTrafficFlow
+
+
+DIRECTIONS = ['N', 'E', 'S', 'W']
+VALUES = np.array([[5, 100, 200, 300],
+                   [110, 6, 210, 310],
+                   [120, 220, 7, 320],
+                   [130, 230, 330, 8]])
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def movement_labels(ax):
+    # U-turns are drawn as annotations, which are texts as well
+    return [text for text in ax.texts if not isinstance(text, Annotation)]
+
+
+def sum_texts(itf):
+    return [text.get_text() for text in itf._sum_texts]
+
+
+def test_update_sum_texts_with_reordered_value_matrix(ax):
+    itf = IntersectionTrafficFlow()
+    itf.plot(ax, VALUES, directions=DIRECTIONS)
+
+    # Same directions in another order, with rows and columns permuted to match
+    reordered = ['W', 'S', 'N', 'E']
+    order = [DIRECTIONS.index(direction) for direction in reordered]
+    new_values = (VALUES * 2)[np.ix_(order, order)]
+    itf.update(new_values, directions=reordered)
+
+    fig, expected_ax = plt.subplots()
+    expected = IntersectionTrafficFlow()
+    expected.plot(expected_ax, VALUES * 2, directions=DIRECTIONS)
+    plt.close(fig)
+    assert sum_texts(itf) == sum_texts(expected)
+    assert '∑ in: 1210' in ' '.join(sum_texts(itf))
+
+
+@pytest.mark.parametrize('directions, values', [
+    (['N', 'E', 'S'], VALUES[:3, :3]),
+    (['N', 'N', 'S', 'W'], VALUES),
+    (['N', 'E', 'S', 'X'], VALUES),
+])
+def test_update_rejects_changed_duplicate_and_unknown_directions(ax, directions, values):
+    itf = IntersectionTrafficFlow()
+    itf.plot(ax, VALUES, directions=DIRECTIONS)
+    with pytest.raises(ValueError):
+        itf.update(values, directions=directions)
+
+
+def test_min_text_value_limits_movement_labels(ax):
+    itf = IntersectionTrafficFlow(individual_movement_text=True, min_text_value=200,
+                                  direction_text=False, sum_movement_text=False)
+    itf.plot(ax, VALUES, directions=DIRECTIONS)
+    assert len(movement_labels(ax)) == np.count_nonzero(np.abs(VALUES) >= 200)
+
+    itf.update(VALUES // 2, directions=DIRECTIONS)
+    assert len(movement_labels(ax)) == np.count_nonzero(np.abs(VALUES // 2) >= 200)
+
+
+def test_blit_update_before_plot_raises(ax):
+    with pytest.raises(RuntimeError):
+        IntersectionTrafficFlow().blit_update(VALUES, directions=DIRECTIONS)
+
+
+def test_blit_update_after_resize(ax):
+    itf = IntersectionTrafficFlow()
+    itf.plot(ax, VALUES, directions=DIRECTIONS)
+    itf.blit_update(VALUES * 2, directions=DIRECTIONS)
+
+    # A full draw at the new size renews the background the next blit restores
+    ax.figure.set_size_inches(8, 8)
+    ax.figure.canvas.draw()
+    itf.blit_update(VALUES * 3, directions=DIRECTIONS)
+    assert np.asarray(ax.figure.canvas.buffer_rgba()).shape[:2] == (800, 800)
+    assert sum_texts(itf)[0].count(str(VALUES.sum(axis=1)[0] * 3)) == 1